@@ -2,30 +2,44 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from uvtx import __version__
 from uvtx.completion import complete_pipeline_name, complete_profile_name, complete_task_name
-from uvtx.config import ConfigError, ConfigNotFoundError, load_config
-from uvtx.executor import ExecutionResult, check_uv_installed
-from uvtx.models import OnFailure, OutputMode, UvrConfig
-from uvtx.runner import Runner
 
-# Heavy imports loaded lazily inside commands that use them:
-# - pt.watch (only for watch command)
-# - rich.panel (only for init command)
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+    from uvtx.executor import ExecutionResult
+    from uvtx.models import UvrConfig
+
+# Heavy imports loaded lazily inside commands that use them. Shell completion
+# re-invokes the CLI on every <TAB>, so module import time is on the hot path:
+# - rich.console / rich.table (only when printing)
+# - uvtx.runner, uvtx.config, uvtx.executor, uvtx.models (only when executing commands)
+# - uvtx.watch (only for watch command)
+
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def print_uv_not_installed_error() -> None:
     """Print a helpful error message when uv is not installed."""
+    console = _get_console()
     console.print("[red]Error:[/red] uv is not installed.")
     console.print("\n[bold]Install uv:[/bold]")
     console.print("  • Linux/macOS: [cyan]curl -LsSf https://astral.sh/uv/install.sh | sh[/cyan]")
@@ -38,25 +52,30 @@ def print_uv_not_installed_error() -> None:
 
 def handle_errors(func: Any) -> Any:
     """Decorator to handle common errors with nice output."""
-    import functools
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         try:
             return func(*args, **kwargs)
-        except ConfigNotFoundError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            console.print("\n[dim]Run 'uvtx init' to create a configuration file.[/dim]")
-            sys.exit(1)
-        except ConfigError as e:
-            console.print(f"[red]Configuration error:[/red]\n{e}")
-            sys.exit(1)
-        except KeyError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
         except KeyboardInterrupt:
-            console.print("\n[yellow]Interrupted[/yellow]")
+            _get_console().print("\n[yellow]Interrupted[/yellow]")
             sys.exit(130)
+        except Exception as e:
+            # Config exceptions are imported lazily to keep CLI startup cheap
+            from uvtx.config import ConfigError, ConfigNotFoundError
+
+            console = _get_console()
+            if isinstance(e, ConfigNotFoundError):
+                console.print(f"[red]Error:[/red] {e}")
+                console.print("\n[dim]Run 'uvtx init' to create a configuration file.[/dim]")
+                sys.exit(1)
+            if isinstance(e, ConfigError):
+                console.print(f"[red]Configuration error:[/red]\n{e}")
+                sys.exit(1)
+            if isinstance(e, KeyError):
+                console.print(f"[red]Error:[/red] {e}")
+                sys.exit(1)
+            raise
 
     return wrapper
 
@@ -98,6 +117,8 @@ def _run_inline_task(
     from uvtx.executor import UvCommand, execute_sync
     from uvtx.models import TaskConfig
 
+    console = _get_console()
+
     # Parse environment variables
     parsed_env: dict[str, str] = {}
     for env_var in env_vars:
@@ -250,6 +271,12 @@ def run(
         uvtx run --inline "pytest tests/"                # Inline command
         uvtx run --inline "python script.py" --env DEBUG=1  # With env vars
     """
+    from uvtx.config import resolve_task_name
+    from uvtx.executor import check_uv_installed
+    from uvtx.runner import Runner
+
+    console = _get_console()
+
     if not check_uv_installed():
         print_uv_not_installed_error()
         sys.exit(1)
@@ -279,8 +306,6 @@ def run(
     runner = Runner.from_config_file(config_path, verbose=verbose, profile=profile)
 
     # Resolve alias to task name
-    from uvtx.config import resolve_task_name
-
     try:
         resolved_task_name = resolve_task_name(runner.config, task_name)
     except ValueError as e:
@@ -322,6 +347,9 @@ def exec_script(
     The script will inherit global environment variables and PYTHONPATH
     from uvtx.toml, and can use PEP 723 inline metadata for dependencies.
     """
+    from uvtx.executor import check_uv_installed
+    from uvtx.runner import Runner
+
     if not check_uv_installed():
         print_uv_not_installed_error()
         sys.exit(1)
@@ -390,6 +418,13 @@ def multi(
 
     Specify TASK_NAMES directly, or use --tag/--category to filter tasks.
     """
+    from uvtx.config import resolve_task_name
+    from uvtx.executor import check_uv_installed
+    from uvtx.models import OnFailure, OutputMode
+    from uvtx.runner import Runner
+
+    console = _get_console()
+
     if not check_uv_installed():
         print_uv_not_installed_error()
         sys.exit(1)
@@ -416,12 +451,11 @@ def multi(
             console.print(f"[yellow]No tasks found with tag(s): {', '.join(tags)}[/yellow]")
             sys.exit(0)
     elif task_names:
-        # Run tasks by name - resolve aliases
-        from uvtx.config import resolve_task_name
-
-        # Resolve all task names/aliases upfront
+        # Run tasks by name - resolve all task names/aliases upfront
         try:
-            final_task_names = [resolve_task_name(runner.config, name) for name in task_names]
+            final_task_names = list(
+                map(functools.partial(resolve_task_name, runner.config), task_names)
+            )
         except ValueError as e:
             console.print(f"[red]Error:[/red] {e}")
             sys.exit(1)
@@ -471,6 +505,9 @@ def pipeline(
 
     PIPELINE_NAME is the name of the pipeline to run.
     """
+    from uvtx.executor import check_uv_installed
+    from uvtx.runner import Runner
+
     if not check_uv_installed():
         print_uv_not_installed_error()
         sys.exit(1)
@@ -507,6 +544,11 @@ def list_tasks(
     config_path: Path | None,
 ) -> None:
     """List available tasks and pipelines."""
+    from rich.table import Table
+
+    from uvtx.config import load_config
+
+    console = _get_console()
     config, _ = load_config(config_path)
 
     # Filter by category first if specified
@@ -530,28 +572,37 @@ def list_tasks(
             table.add_column("Dependencies")
             table.add_column("Tags", style="green")
 
-        for name, task in sorted(filtered_tasks.items()):
-            # Skip private tasks (starting with _) unless --all is specified
-            if name.startswith("_") and not show_all:
-                continue
+        # Skip private tasks (starting with _) unless --all is specified
+        visible_tasks = [
+            (name, task)
+            for name, task in sorted(filtered_tasks.items())
+            if show_all or not name.startswith("_")
+        ]
 
-            if verbose:
-                task_type = "script" if task.script else "cmd" if task.cmd else "group"
-                deps = (
-                    ", ".join(d if isinstance(d, str) else d.task for d in task.depends_on) or "-"
-                )
-                aliases = ", ".join(task.aliases) if task.aliases else "-"
-                category_str = task.category or "-"
-                tags_str = ", ".join(task.tags) if task.tags else "-"
-                table.add_row(
-                    name, aliases, task.description or "-", category_str, task_type, deps, tags_str
+        # Build all rows up front; every row shares the same column layout
+        rows: list[tuple[str, ...]]
+        if verbose:
+            rows = [
+                (
+                    name,
+                    ", ".join(task.aliases) or "-",
+                    task.description or "-",
+                    task.category or "-",
+                    "script" if task.script else "cmd" if task.cmd else "group",
+                    ", ".join(d if isinstance(d, str) else d.task for d in task.depends_on) or "-",
+                    ", ".join(task.tags) or "-",
                 )
-            else:
-                # Show aliases inline in non-verbose mode
-                display_name = name
-                if task.aliases:
-                    display_name = f"{name} ({', '.join(task.aliases)})"
-                table.add_row(display_name)
+                for name, task in visible_tasks
+            ]
+        else:
+            # Show aliases inline in non-verbose mode
+            rows = [
+                (f"{name} ({', '.join(task.aliases)})" if task.aliases else name,)
+                for name, task in visible_tasks
+            ]
+
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -590,6 +641,11 @@ def list_tasks(
 @handle_errors
 def list_tags(config_path: Path | None) -> None:
     """List all tags used in tasks."""
+    from rich.table import Table
+
+    from uvtx.config import load_config
+
+    console = _get_console()
     config, _ = load_config(config_path)
 
     all_tags = config.get_all_tags()
@@ -652,8 +708,12 @@ def watch(
     Additional ARGS are passed to the task's script/command.
     """
     # Lazy import - only load watch module when needed
+    from uvtx.executor import check_uv_installed
+    from uvtx.runner import Runner
     from uvtx.watch import WatchConfig, watch_and_run_sync
 
+    console = _get_console()
+
     if not check_uv_installed():
         print_uv_not_installed_error()
         sys.exit(1)
@@ -700,9 +760,12 @@ def explain(task_name: str, profile: str | None, config_path: Path | None) -> No
         get_effective_runner,
         get_profile_python,
         get_project_root,
+        load_config,
         resolve_task_name,
     )
 
+    console = _get_console()
+
     # Load config with variable interpolation
     config, path = load_config(config_path)
     project_root = get_project_root(path)
@@ -896,6 +959,8 @@ def _load_raw_config(config_path: Path) -> UvrConfig:
 
     import tomllib
 
+    from uvtx.models import UvrConfig
+
     with config_path.open("rb") as f:
         raw_data = tomllib.load(f)
 
@@ -942,6 +1007,10 @@ def check(config_path: Path | None) -> None:
     - Profile and pipeline reference validation
     - Best practice warnings (missing descriptions, timeouts)
     """
+    from uvtx.config import load_config
+    from uvtx.executor import check_uv_installed
+
+    console = _get_console()
     config, path = load_config(config_path)
 
     console.print(f"[green]✓[/green] Configuration valid: {path}")
@@ -950,8 +1019,8 @@ def check(config_path: Path | None) -> None:
     console.print(f"  Pipelines: {len(config.pipelines)}")
     console.print(f"  Dependency groups: {len(config.dependencies)}")
 
-    # Check for uv
-    if check_uv_installed():
+    # Check for uv (actually run it, since check is a diagnostic command)
+    if check_uv_installed(deep=True):
         console.print("[green]✓[/green] uv is installed")
     else:
         console.print("[yellow]![/yellow] uv is not installed")
@@ -1120,9 +1189,11 @@ def graph(
         uvtx graph --format mermaid   # Export as Mermaid diagram
         uvtx graph test -o graph.dot  # Save to file
     """
+    from uvtx.config import load_config
     from uvtx.formatters.graph import format_graph_ascii, format_graph_dot, format_graph_mermaid
     from uvtx.graph import build_task_graph
 
+    console = _get_console()
     config, _ = load_config(config_path)
 
     # Build the task graph
@@ -1172,11 +1243,36 @@ def graph(
         console.print(output)
 
 
+@main.command()
+@click.argument("shell", type=click.Choice(["bash", "zsh", "fish"]))
+def completion(shell: str) -> None:
+    """Print a static shell completion script.
+
+    Save the output once and source it from your shell rc, instead of running
+    uvtx on every shell startup via eval. Task, profile, and pipeline names are
+    still completed dynamically.
+
+    Examples:
+        uvtx completion bash > ~/.uvtx-completion.bash && echo 'source ~/.uvtx-completion.bash' >> ~/.bashrc
+        uvtx completion zsh > ~/.zsh/completions/_uvtx
+        uvtx completion fish > ~/.config/fish/completions/uvtx.fish
+    """
+    from click.shell_completion import get_completion_class
+
+    completion_class = get_completion_class(shell)
+    if completion_class is None:
+        raise click.UsageError(f"Unsupported shell: {shell}")
+
+    script = completion_class(main, {}, "uvtx", "_UVTX_COMPLETE").source()
+    click.echo(script)
+
+
 @main.command()
 @click.option("-f", "--force", is_flag=True, help="Overwrite existing config file")
 @handle_errors
 def init(force: bool) -> None:
     """Initialize a new uvt.toml configuration file."""
+    console = _get_console()
     config_path = Path.cwd() / "uvt.toml"
 
     if config_path.exists() and not force:
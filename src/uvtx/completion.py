@@ -1,12 +1,64 @@
-"""Shell completion support for pt CLI."""
+"""Shell completion support for pt CLI.
+
+The CLI imports this module at startup to attach completers to its
+parameters, so uvtx.config (and with it tomllib and pydantic) is only
+imported once a completion actually misses the on-disk cache.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from click.shell_completion import CompletionItem
 
-from uvtx.config import ConfigNotFoundError, load_config
+from uvtx.completion_cache import Candidate, get_cached_candidates
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _task_candidates() -> tuple[list[Candidate], Path]:
+    """Collect public task names and aliases from the config."""
+    from uvtx.config import load_config
+
+    config, path = load_config()
+    candidates: list[Candidate] = []
+
+    for name, task in config.tasks.items():
+        # Skip private tasks (starting with _)
+        if not name.startswith("_"):
+            # Add main task name
+            candidates.append((name, task.description or ""))
+
+            # Add aliases
+            candidates.extend((alias, f"Alias for {name}") for alias in task.aliases)
+
+    return candidates, path
+
+
+def _profile_candidates() -> tuple[list[Candidate], Path]:
+    """Collect profile names from the config."""
+    from uvtx.config import load_config
+
+    config, path = load_config()
+    return [(name, f"Profile: {name}") for name in config.profiles], path
+
+
+def _pipeline_candidates() -> tuple[list[Candidate], Path]:
+    """Collect pipeline names from the config."""
+    from uvtx.config import load_config
+
+    config, path = load_config()
+    return [(name, pipe.description or "") for name, pipe in config.pipelines.items()], path
+
+
+def _filter_candidates(candidates: list[Candidate], incomplete: str) -> list[CompletionItem]:
+    """Build completion items for candidates matching the incomplete prefix."""
+    return [
+        CompletionItem(value, help=help_text)
+        for value, help_text in candidates
+        if value.startswith(incomplete)
+    ]
 
 
 def complete_task_name(_ctx: Any, _param: Any, incomplete: str) -> list[CompletionItem]:
@@ -21,23 +73,8 @@ def complete_task_name(_ctx: Any, _param: Any, incomplete: str) -> list[Completi
         List of completion items with task names and aliases
     """
     try:
-        config, _ = load_config()
-        tasks: list[CompletionItem] = []
-
-        for name, task in config.tasks.items():
-            # Skip private tasks (starting with _)
-            if not name.startswith("_"):
-                # Add main task name
-                tasks.append(CompletionItem(name, help=task.description or ""))
-
-                # Add aliases
-                if task.aliases:
-                    tasks.extend(
-                        CompletionItem(alias, help=f"Alias for {name}") for alias in task.aliases
-                    )
-
-        return [t for t in tasks if t.value.startswith(incomplete)]
-    except (ConfigNotFoundError, Exception):
+        return _filter_candidates(get_cached_candidates("task", _task_candidates), incomplete)
+    except Exception:
         # Gracefully handle missing config or errors
         return []
 
@@ -54,10 +91,8 @@ def complete_profile_name(_ctx: Any, _param: Any, incomplete: str) -> list[Compl
         List of completion items with profile names
     """
     try:
-        config, _ = load_config()
-        profiles = [CompletionItem(name, help=f"Profile: {name}") for name in config.profiles]
-        return [p for p in profiles if p.value.startswith(incomplete)]
-    except (ConfigNotFoundError, Exception):
+        return _filter_candidates(get_cached_candidates("profile", _profile_candidates), incomplete)
+    except Exception:
         return []
 
 
@@ -73,11 +108,8 @@ def complete_pipeline_name(_ctx: Any, _param: Any, incomplete: str) -> list[Comp
         List of completion items with pipeline names
     """
     try:
-        config, _ = load_config()
-        pipelines = [
-            CompletionItem(name, help=pipe.description or "")
-            for name, pipe in config.pipelines.items()
-        ]
-        return [p for p in pipelines if p.value.startswith(incomplete)]
-    except (ConfigNotFoundError, Exception):
+        return _filter_candidates(
+            get_cached_candidates("pipeline", _pipeline_candidates), incomplete
+        )
+    except Exception:
         return []
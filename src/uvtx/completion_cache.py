@@ -0,0 +1,104 @@
+"""Short-lived on-disk cache for shell completion candidates.
+
+Every <TAB> press spawns a fresh uvtx process, so the in-memory config cache
+never survives between completions. This module persists the candidate list
+for a few seconds so repeated tabs skip TOML parsing and config validation.
+
+Cache entries live at ``$XDG_CACHE_HOME/uvtx/complete-<hash>.json`` (falling
+back to ``~/.cache/uvtx``) and are keyed on the working directory and the kind
+of completion. An entry is valid while its TTL has not expired and the config
+file it was built from still has the same mtime.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# (value, help) pairs offered to the shell
+Candidate: TypeAlias = tuple[str, str]
+
+# How long a cache entry stays valid, in seconds
+COMPLETION_CACHE_TTL = 2.0
+
+
+def get_cache_dir() -> Path:
+    """Return the directory used for completion cache files."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "uvtx"
+
+
+def _cache_file(kind: str) -> Path:
+    """Return the cache file path for a completion kind in the current directory."""
+    key = f"{Path.cwd()}\0{kind}".encode()
+    digest = hashlib.sha1(key, usedforsecurity=False).hexdigest()[:16]
+    return get_cache_dir() / f"complete-{digest}.json"
+
+
+def _read_cache(cache_file: Path) -> list[Candidate] | None:
+    """Read candidates from a cache file, or None if missing, stale, or corrupt."""
+    try:
+        with cache_file.open(encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() >= entry["deadline"]:
+            return None
+        if Path(entry["config_path"]).stat().st_mtime_ns != entry["mtime"]:
+            return None
+        return [(value, help_text) for value, help_text in entry["candidates"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(cache_file: Path, config_path: Path, candidates: list[Candidate]) -> None:
+    """Atomically write candidates to a cache file, ignoring any I/O errors."""
+    try:
+        entry = {
+            "config_path": str(config_path),
+            "mtime": config_path.stat().st_mtime_ns,
+            "deadline": time.time() + COMPLETION_CACHE_TTL,
+            "candidates": candidates,
+        }
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=".complete-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            # Readers see either the old or the new entry, never a partial write
+            Path(tmp_name).replace(cache_file)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def get_cached_candidates(
+    kind: str,
+    loader: Callable[[], tuple[list[Candidate], Path]],
+) -> list[Candidate]:
+    """Return completion candidates, using the on-disk cache when it is fresh.
+
+    Args:
+        kind: Completion kind (e.g. "task", "profile", "pipeline").
+        loader: Computes (candidates, config_path) on a cache miss.
+
+    Returns:
+        List of (value, help) candidates, unfiltered.
+    """
+    cache_file = _cache_file(kind)
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        return cached
+
+    candidates, config_path = loader()
+    _write_cache(cache_file, config_path, candidates)
+    return candidates
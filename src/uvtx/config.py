@@ -23,6 +23,11 @@ class ConfigNotFoundError(ConfigError):
 # Key: config file path, Value: (mtime, parsed config)
 _config_cache: dict[Path, tuple[float, UvrConfig]] = {}
 
+# Name/alias index for the most recently resolved tasks mapping
+# Value: (tasks mapping the index was built from, name or alias -> canonical name)
+# Keyed on identity, so configs rebuilt via model_copy(update={"tasks": ...}) get a fresh index
+_task_name_index: tuple[dict[str, TaskConfig], dict[str, str]] | None = None
+
 
 def find_config_file(start_dir: Path | None = None) -> Path:
     """Find the pt config file by walking up the directory tree.
@@ -517,6 +522,19 @@ def get_profile_dependencies(
     return result
 
 
+def _get_task_name_index(config: UvrConfig) -> dict[str, str]:
+    """Get a mapping of every task name and alias to its canonical task name."""
+    global _task_name_index
+
+    if _task_name_index is None or _task_name_index[0] is not config.tasks:
+        index = {alias: name for name, task in config.tasks.items() for alias in task.aliases}
+        # Task names take precedence over aliases
+        index.update((name, name) for name in config.tasks)
+        _task_name_index = (config.tasks, index)
+
+    return _task_name_index[1]
+
+
 def resolve_task_name(config: UvrConfig, name_or_alias: str) -> str:
     """Resolve task alias to canonical task name.
 
@@ -530,14 +548,10 @@ def resolve_task_name(config: UvrConfig, name_or_alias: str) -> str:
     Raises:
         ValueError: If name_or_alias doesn't match any task or alias
     """
-    # Check if it's a task name
-    if name_or_alias in config.tasks:
-        return name_or_alias
-
-    # Check if it's an alias
-    for task_name, task in config.tasks.items():
-        if name_or_alias in task.aliases:
-            return task_name
+    # O(1) lookup of task names and aliases
+    task_name = _get_task_name_index(config).get(name_or_alias)
+    if task_name is not None:
+        return task_name
 
     # Not found - generate helpful error message
     from difflib import get_close_matches
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import os
 import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, TextIO, TypeAlias
@@ -18,8 +20,33 @@ from uvtx.models import OutputMode
 # Type alias for output queue used in async execution
 OutputQueue: TypeAlias = asyncio.Queue[tuple[str, str]] | None
 
+# Bytes requested per read when collecting subprocess output asynchronously
+_READ_CHUNK_SIZE = 64 * 1024
 
-@dataclass(frozen=True)
+
+@functools.lru_cache(maxsize=1)
+def _base_env() -> dict[str, str]:
+    """Snapshot of os.environ, taken once and shared by every command.
+
+    Copying os.environ decodes every key and value in Python, whereas copying
+    this plain dict is a single C-level operation. Call ``refresh_base_env()``
+    after modifying os.environ to make the change visible to new commands.
+    """
+    return os.environ.copy()
+
+
+def refresh_base_env() -> None:
+    """Discard the cached os.environ snapshot used by ``UvCommand.build_env()``."""
+    _base_env.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Split a shell-style command string, memoized for repeated task commands."""
+    return tuple(shlex.split(command))
+
+
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     """Result of executing a command."""
 
@@ -32,14 +59,15 @@ class ExecutionResult:
     skip_reason: str = ""
     original_return_code: int | None = None  # Original exit code before ignore_failure
     failure_ignored: bool = False  # Whether failure was ignored due to - prefix
+    # Whether the command succeeded (return code 0 or skipped), computed once at construction
+    success: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def success(self) -> bool:
-        """Whether the command succeeded (return code 0 or skipped)."""
-        return self.return_code == 0 or self.skipped
+    def __post_init__(self) -> None:
+        """Compute the success flag from the final return code."""
+        object.__setattr__(self, "success", self.return_code == 0 or self.skipped)
 
 
-@dataclass
+@dataclass(slots=True)
 class UvCommand:
     """Builder for uv run commands."""
 
@@ -73,37 +101,32 @@ class UvCommand:
 
         # Add Python version if specified
         if self.python:
-            command.extend(["--python", self.python])
+            command += ("--python", self.python)
 
-        # Add dependencies
+        # Add dependencies (appended pairwise to avoid a temporary list per dep)
         for dep in self.dependencies:
-            command.extend(["--with", dep])
+            command.append("--with")
+            command.append(dep)
 
-        # Add runner prefix if specified
-        runner_parts = []
-        if self.runner:
-            runner_parts = shlex.split(self.runner)
-
-        # Add script or command
+        # Add runner prefix and script or command:
+        # uv run [--python X] [--with Y] runner (script | cmd) args
         if self.script:
-            # For scripts: uv run [--python X] [--with Y] runner script args
-            if runner_parts:
-                command.extend(runner_parts)
+            if self.runner:
+                command += _split_command(self.runner)
             command.append(self.script)
         elif self.cmd:
-            # For cmd mode: uv run [--python X] [--with Y] runner cmd
-            if runner_parts:
-                command.extend(runner_parts)
-            command.extend(shlex.split(self.cmd))
+            if self.runner:
+                command += _split_command(self.runner)
+            command += _split_command(self.cmd)
 
         # Add additional arguments
-        command.extend(self.args)
+        command += self.args
 
         return command
 
     def build_env(self) -> dict[str, str]:
         """Build environment dict, merging with current environment."""
-        result = os.environ.copy()
+        result = _base_env().copy()
         result.update(self.env)
         return result
 
@@ -200,13 +223,18 @@ def execute_sync(
         else:
             stderr_fd = None
 
+        # Only decode when something is piped back to us; otherwise the child
+        # writes straight to the inherited descriptors (terminal, file, devnull)
+        uses_pipe = stdout_fd == subprocess.PIPE or stderr_fd == subprocess.PIPE
+
         result = subprocess.run(
             cmd_list,
+            executable=_resolve_uv(env),
             env=env,
             cwd=command.cwd,
             stdout=stdout_fd,
             stderr=stderr_fd,
-            text=True,
+            text=uses_pipe,
             check=False,
             timeout=timeout,
         )
@@ -269,7 +297,8 @@ async def execute_async(
     Args:
         command: The UvCommand to execute.
         output_mode: How to handle output (buffered or interleaved).
-        on_stdout: Queue to send output lines for interleaved mode.
+        on_stdout: Queue to send output lines for interleaved mode. Streamed
+            stdout is not retained in the result.
         task_name: Name of the task for labeling output.
         timeout: Timeout in seconds, or None for no timeout.
 
@@ -282,6 +311,7 @@ async def execute_async(
     try:
         process = await asyncio.create_subprocess_exec(
             *cmd_list,
+            executable=_resolve_uv(env),
             env=env,
             cwd=command.cwd,
             stdout=asyncio.subprocess.PIPE,
@@ -302,55 +332,79 @@ async def execute_async(
             command=cmd_list,
         )
 
-    stdout_lines: list[str] = []
-    stderr_lines: list[str] = []
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
+    prefix = f"[{task_name}] " if task_name else ""
 
     async def read_stream(
         stream: asyncio.StreamReader,
-        lines: list[str],
-        _is_stderr: bool = False,
+        buf: bytearray,
+        retain: bool = True,
     ) -> None:
+        # Accumulate raw bytes in large chunks; in interleaved mode, only the
+        # completed lines are decoded and forwarded as they arrive. With
+        # retain=False, forwarded lines are dropped so memory stays bounded.
+        line_start = len(buf)
         while True:
-            line = await stream.readline()
-            if not line:
+            chunk = await stream.read(_READ_CHUNK_SIZE)
+            if not chunk:
                 break
-            decoded = line.decode("utf-8", errors="replace")
-            lines.append(decoded)
-            if output_mode == OutputMode.INTERLEAVED and on_stdout:
-                prefix = f"[{task_name}] " if task_name else ""
-                await on_stdout.put((task_name, prefix + decoded))
+            search_from = len(buf)
+            buf.extend(chunk)
+            if output_mode != OutputMode.INTERLEAVED or on_stdout is None:
+                continue
+            newline = buf.find(b"\n", search_from)
+            while newline != -1:
+                line = buf[line_start : newline + 1].decode("utf-8", errors="replace")
+                await on_stdout.put((task_name, prefix + line))
+                line_start = newline + 1
+                newline = buf.find(b"\n", line_start)
+            if not retain:
+                del buf[:line_start]
+                line_start = 0
+
+        # Flush a trailing line without a newline
+        if output_mode == OutputMode.INTERLEAVED and on_stdout is not None:
+            if line_start < len(buf):
+                line = buf[line_start:].decode("utf-8", errors="replace")
+                await on_stdout.put((task_name, prefix + line))
+            if not retain:
+                buf.clear()
 
     if process.stdout is None or process.stderr is None:
         raise RuntimeError("Failed to create subprocess with stdout/stderr pipes")
 
+    # Interleaved stdout has already been shown by the consumer, so it is not
+    # kept in the result. stderr is always kept for the error handler
+    # (UVR_ERROR_STDERR).
+    retain_stdout = output_mode != OutputMode.INTERLEAVED or on_stdout is None
+    stdout_task = asyncio.create_task(read_stream(process.stdout, stdout_buf, retain=retain_stdout))
+    stderr_task = asyncio.create_task(read_stream(process.stderr, stderr_buf))
+    wait_task = asyncio.create_task(process.wait())
+    tasks = {stdout_task, stderr_task, wait_task}
+
     try:
-        await asyncio.wait_for(
-            asyncio.gather(
-                read_stream(process.stdout, stdout_lines),
-                read_stream(process.stderr, stderr_lines, _is_stderr=True),
-            ),
-            timeout=timeout,
-        )
-        return_code = await process.wait()
-    except TimeoutError:
-        process.kill()
-        # Give stream readers a chance to finish reading buffered data
-        with contextlib.suppress(asyncio.TimeoutError):
-            await asyncio.wait_for(
-                asyncio.gather(
-                    read_stream(process.stdout, stdout_lines),
-                    read_stream(process.stderr, stderr_lines, _is_stderr=True),
-                ),
-                timeout=1.0,
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            # Return whatever output was collected before the timeout. stderr is
+            # replaced by the timeout message, so there is nothing to drain for it.
+            await process.wait()
+            return ExecutionResult(
+                return_code=124,
+                stdout=stdout_buf.decode("utf-8", errors="replace"),
+                stderr=f"Command timed out after {timeout} seconds",
+                command=cmd_list,
+                timed_out=True,
             )
-        await process.wait()
-        return ExecutionResult(
-            return_code=124,
-            stdout="".join(stdout_lines),
-            stderr=f"Command timed out after {timeout} seconds",
-            command=cmd_list,
-            timed_out=True,
-        )
+        # Surface any reader errors
+        stdout_task.result()
+        stderr_task.result()
+        return_code = wait_task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
 
     # Handle ignore_failure flag (command prefix "- ")
     original_return_code = None
@@ -362,16 +416,46 @@ async def execute_async(
 
     return ExecutionResult(
         return_code=return_code,
-        stdout="".join(stdout_lines),
-        stderr="".join(stderr_lines),
+        stdout=stdout_buf.decode("utf-8", errors="replace"),
+        stderr=stderr_buf.decode("utf-8", errors="replace"),
         command=cmd_list,
         original_return_code=original_return_code,
         failure_ignored=failure_ignored,
     )
 
 
-def check_uv_installed() -> bool:
-    """Check if uv is installed and accessible."""
+@functools.lru_cache(maxsize=1)
+def _which_uv(path: str) -> str | None:
+    """Resolve the uv executable on the given PATH (cached per PATH value)."""
+    return shutil.which("uv", path=path)
+
+
+def _resolve_uv(env: dict[str, str]) -> str | None:
+    """Resolve the absolute path of uv using the child's PATH.
+
+    Passing the resolved path as ``executable`` spares each spawn from searching
+    PATH. Returns None when uv is not found, leaving the lookup (and its
+    FileNotFoundError) to subprocess as before.
+    """
+    return _which_uv(env.get("PATH", os.defpath))
+
+
+def check_uv_installed(deep: bool = False) -> bool:
+    """Check if uv is installed and accessible.
+
+    Args:
+        deep: Also run ``uv --version`` to verify the binary actually starts.
+            The default only looks uv up on PATH, which avoids spawning a
+            process on every CLI invocation.
+
+    Returns:
+        True if uv is available.
+    """
+    if _which_uv(os.environ.get("PATH", os.defpath)) is None:
+        return False
+    if not deep:
+        return True
+
     try:
         result = subprocess.run(
             ["uv", "--version"],
@@ -380,5 +464,5 @@ def check_uv_installed() -> bool:
             check=False,
         )
         return result.returncode == 0
-    except FileNotFoundError:
+    except OSError:
         return False
@@ -233,3 +233,28 @@ def test_get_task_by_alias(tmp_path: Path) -> None:
     task_by_name = config.get_task("test")
     task_by_alias = config.get_task("t")
     assert task_by_name is task_by_alias
+
+
+def test_alias_resolution_after_tasks_replaced(tmp_path: Path) -> None:
+    """Test that alias resolution follows configs rebuilt with new tasks."""
+    config_file = tmp_path / "uvt.toml"
+    config_file.write_text(
+        textwrap.dedent("""
+            [tasks.test]
+            cmd = "pytest"
+            aliases = ["t"]
+        """)
+    )
+
+    config, _ = load_config(config_file)
+    assert resolve_task_name(config, "t") == "test"
+
+    renamed = config.model_copy(
+        update={"tasks": {"check": config.tasks["test"].model_copy(update={"aliases": ["c"]})}}
+    )
+    assert resolve_task_name(renamed, "c") == "check"
+    with pytest.raises(ValueError, match="not found"):
+        resolve_task_name(renamed, "t")
+
+    # The original config still resolves against its own tasks
+    assert resolve_task_name(config, "t") == "test"
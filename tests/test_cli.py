@@ -389,6 +389,108 @@ class TestCheckCommand:
         assert "_private" not in result.output or "No issues found" in result.output
 
 
+class TestListCommand:
+    """Tests for the 'list' command."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path: Path) -> Path:
+        config_file = tmp_path / "uvt.toml"
+        config_file.write_text(
+            dedent("""
+            [tasks.lint]
+            description = "Lint"
+            cmd = "ruff check"
+            aliases = ["l"]
+            tags = ["ci"]
+
+            [tasks.ci]
+            depends_on = ["lint"]
+
+            [tasks._setup]
+            cmd = "echo setup"
+        """)
+        )
+        return config_file
+
+    def test_list_hides_private_tasks(self, runner: CliRunner, config_file: Path) -> None:
+        result = runner.invoke(main, ["list", "-c", str(config_file)])
+        assert result.exit_code == 0
+        assert "lint (l)" in result.output
+        assert "_setup" not in result.output
+
+    def test_list_all_shows_private_tasks(self, runner: CliRunner, config_file: Path) -> None:
+        result = runner.invoke(main, ["list", "--all", "-c", str(config_file)])
+        assert result.exit_code == 0
+        assert "_setup" in result.output
+
+    def test_list_verbose_columns(self, runner: CliRunner, config_file: Path) -> None:
+        result = runner.invoke(main, ["list", "-v", "-c", str(config_file)])
+        assert result.exit_code == 0
+        assert "group" in result.output
+        assert "cmd" in result.output
+        assert "ci" in result.output
+
+
+class TestMultiCommand:
+    """Tests for the 'multi' command."""
+
+    def test_multi_resolves_aliases(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that task aliases are resolved before running."""
+        config_file = tmp_path / "uvt.toml"
+        config_file.write_text(
+            dedent("""
+            [tasks.hello]
+            cmd = "echo hello"
+            aliases = ["h"]
+
+            [tasks.world]
+            cmd = "echo world"
+        """)
+        )
+
+        result = runner.invoke(main, ["multi", "h", "world", "-c", str(config_file)])
+        assert result.exit_code == 0
+
+    def test_multi_unknown_task(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that an unknown task name is reported as an error."""
+        config_file = tmp_path / "uvt.toml"
+        config_file.write_text(
+            dedent("""
+            [tasks.hello]
+            cmd = "echo hello"
+        """)
+        )
+
+        result = runner.invoke(main, ["multi", "hello", "nope", "-c", str(config_file)])
+        assert result.exit_code == 1
+        assert "nope" in result.output
+
+
+class TestCompletionCommand:
+    """Tests for the 'completion' command."""
+
+    @pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+    def test_completion_prints_script(self, runner: CliRunner, shell: str) -> None:
+        """Test that a static completion script is printed for each shell."""
+        result = runner.invoke(main, ["completion", shell])
+        assert result.exit_code == 0
+        assert "_UVTX_COMPLETE" in result.output
+        assert f"{shell}_complete" in result.output
+
+    def test_completion_does_not_need_config(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the script can be generated outside a project."""
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["completion", "bash"])
+        assert result.exit_code == 0
+
+    def test_completion_rejects_unknown_shell(self, runner: CliRunner) -> None:
+        """Test that unsupported shells are rejected."""
+        result = runner.invoke(main, ["completion", "powershell"])
+        assert result.exit_code != 0
+
+
 class TestValidateConfig:
     """Tests for the _validate_config function."""
 
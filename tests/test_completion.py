@@ -1,11 +1,13 @@
 """Tests for shell completion."""
 
+import os
 from pathlib import Path
 from textwrap import dedent
 from unittest.mock import Mock
 
 import pytest
 
+from uvtx import completion_cache
 from uvtx.completion import (
     complete_pipeline_name,
     complete_profile_name,
@@ -13,6 +15,14 @@ from uvtx.completion import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep completion cache files out of the user's real cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    return cache_dir
+
+
 def test_complete_task_names(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test task name completion returns task names and aliases."""
     # Create test config
@@ -209,3 +219,113 @@ def test_complete_task_with_aliases_description(
     # Check that alias items have helpful descriptions
     for item in alias_items:
         assert "Alias for lint" in item.help
+
+
+def test_completion_cache_hit_skips_config_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a fresh cache entry is served without reloading the config."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "uvtx.toml").write_text(
+        dedent("""
+        [tasks.test]
+        cmd = "pytest"
+        """)
+    )
+    monkeypatch.chdir(project)
+
+    first = complete_task_name(Mock(), Mock(), "")
+    assert [r.value for r in first] == ["test"]
+
+    def fail_load(*_args: object) -> None:
+        raise AssertionError("config should not be loaded on cache hit")
+
+    monkeypatch.setattr("uvtx.config.load_config", fail_load)
+
+    second = complete_task_name(Mock(), Mock(), "te")
+    assert [r.value for r in second] == ["test"]
+
+
+def test_completion_cache_invalidated_on_mtime_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that editing the config invalidates cached candidates."""
+    project = tmp_path / "project"
+    project.mkdir()
+    config_file = project / "uvtx.toml"
+    config_file.write_text(
+        dedent("""
+        [tasks.test]
+        cmd = "pytest"
+        """)
+    )
+    monkeypatch.chdir(project)
+
+    assert [r.value for r in complete_task_name(Mock(), Mock(), "")] == ["test"]
+
+    config_file.write_text(
+        dedent("""
+        [tasks.lint]
+        cmd = "ruff"
+        """)
+    )
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert [r.value for r in complete_task_name(Mock(), Mock(), "")] == ["lint"]
+
+
+def test_completion_cache_expires_after_ttl(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cache entries are recomputed once the TTL has passed."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "uvtx.toml").write_text(
+        dedent("""
+        [profiles.dev]
+        env = { DEBUG = "1" }
+        """)
+    )
+    monkeypatch.chdir(project)
+
+    calls = 0
+
+    def loader() -> tuple[list[completion_cache.Candidate], Path]:
+        nonlocal calls
+        calls += 1
+        return [("dev", "Profile: dev")], project / "uvtx.toml"
+
+    now = 1000.0
+    monkeypatch.setattr(completion_cache.time, "time", lambda: now)
+
+    assert completion_cache.get_cached_candidates("profile", loader) == [("dev", "Profile: dev")]
+    assert completion_cache.get_cached_candidates("profile", loader) == [("dev", "Profile: dev")]
+    assert calls == 1
+
+    now += completion_cache.COMPLETION_CACHE_TTL
+    completion_cache.get_cached_candidates("profile", loader)
+    assert calls == 2
+
+
+def test_completion_cache_ignores_corrupt_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, isolated_cache_dir: Path
+) -> None:
+    """Test that a corrupt cache file falls back to loading the config."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "uvtx.toml").write_text(
+        dedent("""
+        [tasks.test]
+        cmd = "pytest"
+        """)
+    )
+    monkeypatch.chdir(project)
+
+    complete_task_name(Mock(), Mock(), "")
+    cache_files = list((isolated_cache_dir / "uvtx").glob("complete-*.json"))
+    assert len(cache_files) == 1
+    cache_files[0].write_text("{not json")
+
+    assert [r.value for r in complete_task_name(Mock(), Mock(), "")] == ["test"]
@@ -1,6 +1,20 @@
 """Tests for pt.executor."""
 
-from uvtx.executor import UvCommand
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from uvtx.executor import (
+    ExecutionResult,
+    UvCommand,
+    check_uv_installed,
+    execute_async,
+    execute_sync,
+    refresh_base_env,
+)
+from uvtx.models import OutputMode
 
 
 class TestUvCommand:
@@ -42,6 +56,13 @@ class TestUvCommand:
         result = cmd.build()
         assert result == ["uv", "run", "python", "-c", "print(1)"]
 
+    def test_cmd_build_is_independent_per_call(self) -> None:
+        """Repeated builds of the same cmd return fresh lists."""
+        first = UvCommand(cmd="ruff check src/", runner="dotenv run").build()
+        first.append("--fix")
+        second = UvCommand(cmd="ruff check src/", runner="dotenv run").build()
+        assert second == ["uv", "run", "dotenv", "run", "ruff", "check", "src/"]
+
     def test_cmd_with_dependencies(self) -> None:
         cmd = UvCommand(
             cmd="ruff check src/",
@@ -85,6 +106,26 @@ class TestUvCommand:
         # Should also include current env
         assert "PATH" in env  # Standard env var
 
+    def test_build_env_does_not_leak_between_commands(self) -> None:
+        first = UvCommand(cmd="echo", env={"UVTX_TEST_ONLY_FIRST": "1"})
+        second = UvCommand(cmd="echo")
+
+        assert "UVTX_TEST_ONLY_FIRST" in first.build_env()
+        assert "UVTX_TEST_ONLY_FIRST" not in second.build_env()
+
+    def test_build_env_refresh_picks_up_environ_changes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cmd = UvCommand(cmd="echo")
+        cmd.build_env()  # Populate the snapshot
+
+        monkeypatch.setenv("UVTX_TEST_REFRESH", "yes")
+        refresh_base_env()
+
+        assert cmd.build_env()["UVTX_TEST_REFRESH"] == "yes"
+        monkeypatch.delenv("UVTX_TEST_REFRESH")
+        refresh_base_env()
+
     def test_ignore_failure_cmd_prefix(self) -> None:
         """Test that '- ' prefix in cmd sets ignore_failure and strips prefix."""
         cmd = UvCommand(cmd="- rm -rf temp/")
@@ -118,3 +159,144 @@ class TestUvCommand:
         cmd = UvCommand(cmd="-v --verbose")
         assert cmd.ignore_failure is False
         assert cmd.cmd == "-v --verbose"
+
+
+class TestExecutionResult:
+    """Tests for ExecutionResult."""
+
+    def test_success(self) -> None:
+        assert ExecutionResult(return_code=0, stdout="", stderr="", command=[]).success
+        assert not ExecutionResult(return_code=1, stdout="", stderr="", command=[]).success
+        assert ExecutionResult(
+            return_code=1, stdout="", stderr="", command=[], skipped=True
+        ).success
+
+    def test_uses_slots(self) -> None:
+        result = ExecutionResult(return_code=0, stdout="", stderr="", command=["uv"])
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(UvCommand(cmd="echo"), "__dict__")
+
+
+class TestCheckUvInstalled:
+    """Tests for check_uv_installed."""
+
+    def test_not_found_on_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert check_uv_installed() is False
+        assert check_uv_installed(deep=True) is False
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell script as fake uv")
+    def test_found_on_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake_uv = tmp_path / "uv"
+        fake_uv.write_text("#!/bin/sh\nexit 0\n")
+        fake_uv.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert check_uv_installed() is True
+        assert check_uv_installed(deep=True) is True
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell script as fake uv")
+    def test_deep_check_runs_uv(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A uv binary that fails to run is only detected by the deep check."""
+        fake_uv = tmp_path / "uv"
+        fake_uv.write_text("#!/bin/sh\nexit 1\n")
+        fake_uv.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert check_uv_installed() is True
+        assert check_uv_installed(deep=True) is False
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses bash to produce output")
+class TestExecuteSync:
+    """Tests for execute_sync output handling."""
+
+    def test_captured_output(self, tmp_path: Path) -> None:
+        cmd = UvCommand(cmd="bash", args=["-c", "echo out; echo err >&2"], cwd=tmp_path)
+        result = execute_sync(cmd, capture_output=True)
+
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    def test_uv_resolved_from_command_path(self, tmp_path: Path) -> None:
+        """uv is looked up on the PATH the command will run with."""
+        fake_uv = tmp_path / "uv"
+        fake_uv.write_text('#!/bin/sh\necho fake-uv "$@"\n')
+        fake_uv.chmod(0o755)
+        cmd = UvCommand(cmd="echo hi", env={"PATH": str(tmp_path)}, cwd=tmp_path)
+        result = execute_sync(cmd)
+
+        assert result.stdout == "fake-uv run echo hi\n"
+        assert result.command[0] == "uv"
+
+    def test_uncaptured_output_is_inherited(
+        self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        cmd = UvCommand(cmd="bash", args=["-c", "echo out; exit 3"], cwd=tmp_path)
+        result = execute_sync(cmd, capture_output=False)
+
+        assert result.return_code == 3
+        assert result.stdout == ""
+        assert result.stderr == ""
+        assert "out" in capfd.readouterr().out
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses bash to produce output")
+class TestExecuteAsync:
+    """Tests for execute_async output collection."""
+
+    async def test_buffered_output(self, tmp_path: Path) -> None:
+        cmd = UvCommand(
+            cmd="bash", args=["-c", "printf 'a\\nb\\n'; printf 'err' >&2"], cwd=tmp_path
+        )
+        result = await execute_async(cmd)
+
+        assert result.return_code == 0
+        assert result.stdout == "a\nb\n"
+        assert result.stderr == "err"
+
+    async def test_large_output_without_newlines(self, tmp_path: Path) -> None:
+        """Output larger than the read chunk size with no line breaks is kept intact."""
+        cmd = UvCommand(
+            cmd="bash", args=["-c", "head -c 200000 /dev/zero | tr '\\0' x"], cwd=tmp_path
+        )
+        result = await execute_async(cmd)
+
+        assert result.stdout == "x" * 200000
+
+    async def test_interleaved_output_is_split_into_lines(self, tmp_path: Path) -> None:
+        cmd = UvCommand(cmd="bash", args=["-c", "printf 'one\\ntwo\\nthree'"], cwd=tmp_path)
+        queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        result = await execute_async(
+            cmd, output_mode=OutputMode.INTERLEAVED, on_stdout=queue, task_name="t"
+        )
+
+        lines = []
+        while not queue.empty():
+            lines.append(queue.get_nowait())
+        assert lines == [("t", "[t] one\n"), ("t", "[t] two\n"), ("t", "[t] three")]
+        assert result.return_code == 0
+
+    async def test_interleaved_stdout_not_retained(self, tmp_path: Path) -> None:
+        """Streamed stdout is dropped from the result; stderr is kept for error handlers."""
+        cmd = UvCommand(
+            cmd="bash", args=["-c", "printf 'out\\n'; printf 'err\\n' >&2"], cwd=tmp_path
+        )
+        queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        result = await execute_async(cmd, output_mode=OutputMode.INTERLEAVED, on_stdout=queue)
+
+        assert queue.qsize() == 2
+        assert result.stdout == ""
+        assert result.stderr == "err\n"
+
+    async def test_timeout_kills_process_and_keeps_output(self, tmp_path: Path) -> None:
+        # The sleeper detaches from the pipes so the readers see EOF once uv is killed
+        cmd = UvCommand(
+            cmd="bash",
+            args=["-c", "echo started; exec sleep 30 >/dev/null 2>&1"],
+            cwd=tmp_path,
+        )
+        result = await execute_async(cmd, timeout=2)
+
+        assert result.timed_out
+        assert result.return_code == 124
+        assert "started" in result.stdout
+        assert "timed out after 2 seconds" in result.stderr
@@ -6,6 +6,8 @@ Tests verify that optimizations maintain expected performance characteristics:
 - Script metadata caching improves repeated parsing
 """
 
+import subprocess
+import sys
 import time
 from pathlib import Path
 from textwrap import dedent
@@ -281,6 +283,23 @@ class TestAlgorithmicComplexity:
         )
 
 
+class TestCliStartup:
+    """Test that importing the CLI (done on every shell completion) stays lightweight."""
+
+    def test_cli_import_defers_heavy_modules(self) -> None:
+        """Importing uvtx.cli should not load config, runner, executor, or Rich tables."""
+        code = (
+            "import sys, uvtx.cli; "
+            "heavy = ['uvtx.config', 'uvtx.runner', 'uvtx.executor', 'uvtx.parallel', "
+            "'pydantic', 'tomllib', 'rich.table']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+
 class TestRegressionBenchmarks:
     """High-level benchmarks to catch performance regressions."""
 